@@ -0,0 +1,65 @@
+# ----------------------------------------------------------------------
+# Copyright (c) 2024 Rafael Gonzalez.
+#
+# See the LICENSE file for details
+# ----------------------------------------------------------------------
+
+#--------------------
+# System wide imports
+# -------------------
+
+import sys
+import logging
+import asyncio
+
+# -------------------
+# Third party imports
+# -------------------
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from lica.textual.argparse import args_parser
+from lica.textual.logging import configure_logging
+
+#--------------
+# local imports
+# -------------
+
+from . import __version__
+
+# -----------------------
+# Module global variables
+# -----------------------
+
+# Faster libuv-based event loop for all asyncio.run() entry points
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# -------------------
+# Auxiliary functions
+# -------------------
+
+def init_cli(name, description, add_args_func=None):
+    '''Common argument parsing and logging setup shared by all entry points'''
+    parser = args_parser(
+        name = name,
+        version = __version__,
+        description = description
+    )
+    if add_args_func is not None:
+        add_args_func(parser)
+    args = parser.parse_args(sys.argv[1:])
+    configure_logging(args)
+    return args
+
+
+def configure_sql_logging(args):
+    '''Tame SQLAlchemy logging noise for the database entry points'''
+    if args.verbose:
+        logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+        logging.getLogger("aiosqlite").setLevel(logging.INFO)
+    else:
+        logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
@@ -20,8 +20,6 @@ import sqlite3
 # Third party imports
 # -------------------
 
-from lica.textual.logging import configure_logging
-from lica.textual.argparse import args_parser
 from lica.validators import vfile, vdir
 from lica.sqlite import open_database
 
@@ -29,7 +27,7 @@ from lica.sqlite import open_database
 # local imports
 # -------------
 
-from .. import __version__
+from ..cli import init_cli
 
 # ----------------
 # Module constants
@@ -166,32 +164,21 @@ def add_args(parser):
 
     subparser = parser.add_subparsers(dest='command')
 
-    parser_config = subparser.add_parser('config', help='Load config CSV')
-    parser_batch = subparser.add_parser('batch', help='Load config CSV')
-    parser_phot = subparser.add_parser('photometer', help='Load photometer CSV')
-    parser_summary = subparser.add_parser('summary', help='Load summary CSV')
-    parser_rounds = subparser.add_parser('rounds', help='Load rounds CSV')
-    parser_samples = subparser.add_parser('samples', help='Load samples CSV')
-    parser_all = subparser.add_parser('all', help='Load all CSVs')
-
-    parser_config.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
-    parser_batch.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
-    parser_phot.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
-    parser_summary.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
-    parser_rounds.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
-    parser_samples.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
-    parser_all.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
+    # Shared by all subcommands, wired once via the parents mechanism
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
+
+    subparser.add_parser('config', parents=[common], help='Load config CSV')
+    subparser.add_parser('batch', parents=[common], help='Load config CSV')
+    subparser.add_parser('photometer', parents=[common], help='Load photometer CSV')
+    subparser.add_parser('summary', parents=[common], help='Load summary CSV')
+    subparser.add_parser('rounds', parents=[common], help='Load rounds CSV')
+    subparser.add_parser('samples', parents=[common], help='Load samples CSV')
+    subparser.add_parser('all', parents=[common], help='Load all CSVs')
 
 def main():
     '''The main entry point specified by pyproject.toml'''
-    parser = args_parser(
-        name = __name__,
-        version = __version__,
-        description = DESCRIPTION
-    )
-    add_args(parser)
-    args = parser.parse_args(sys.argv[1:])
-    configure_logging(args)
+    args = init_cli(__name__, DESCRIPTION, add_args)
     extract(args)
 
 if __name__ == '__main__':
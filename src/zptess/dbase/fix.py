@@ -22,8 +22,6 @@ import statistics
 # Third party imports
 # -------------------
 
-from lica.textual.logging import configure_logging
-from lica.textual.argparse import args_parser
 from lica.sqlite import open_database
 from lica.validators import vdate
 
@@ -31,7 +29,7 @@ from lica.validators import vdate
 # local imports
 # -------------
 
-from .. import __version__
+from ..cli import init_cli
 from .. import CentralTendency
 
 # ----------------
@@ -158,14 +156,7 @@ def add_args(parser):
 
 def main():
     '''The main entry point specified by pyproject.toml'''
-    parser = args_parser(
-        name = __name__,
-        version = __version__,
-        description = DESCRIPTION
-    )
-    add_args(parser)
-    args = parser.parse_args(sys.argv[1:])
-    configure_logging(args)
+    args = init_cli(__name__, DESCRIPTION, add_args)
     fix(args)
 
 if __name__ == '__main__':
@@ -15,27 +15,26 @@ import logging
 import argparse
 import asyncio
 import datetime
+import itertools
 
 # -------------------
 # Third party imports
 # -------------------
 
 
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from sqlalchemy.ext.asyncio import AsyncSession as AsyncSessionClass
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from lica.sqlalchemy.asyncio.dbase import engine, AsyncSession
 from lica.asyncio.photometer import Model as PhotModel, Role, Sensor
-from lica.textual.logging import configure_logging
-from lica.textual.argparse import args_parser
 from lica.validators import vfile, vdir
 
 #--------------
 # local imports
 # -------------
 
-from .. import __version__
+from ..cli import init_cli, configure_sql_logging
 from .model import Config, Round, Photometer, Sample, Summary, Batch
 
 # ----------------
@@ -44,6 +43,13 @@ from .model import Config, Round, Photometer, Sample, Summary, Batch
 
 DESCRIPTION = "TESS-W Calibration Database data loader tool"
 
+# Rows per transaction in bulk loads, bounding peak memory on large CSVs
+BATCH_SIZE = 10_000
+
+# 1 MiB read buffer for bulk CSV loads, far fewer read() syscalls
+# than the default 8 KiB on multi-megabyte exports
+CSV_BUF_SIZE = 1 << 20
+
 # -----------------------
 # Module global variables
 # -----------------------
@@ -87,18 +93,22 @@ async def load_config(path, async_session: async_sessionmaker[AsyncSessionClass]
 
 async def load_photometer(path, async_session: async_sessionmaker[AsyncSessionClass]) -> None:
     async with async_session() as session:
-        async with session.begin():
-            log.info("loading photometer from %s", path)
-            with open(path, newline='') as f:
-                reader = csv.DictReader(f, delimiter=';')
-                for row in reader:
-                    row['sensor'] = None if not row['sensor'] else row['sensor']
-                    row['firmware'] = None if not row['firmware'] else row['firmware']
-                    row['filter'] = None if not row['filter'] else row['filter']
-                    row['collector'] = None if not row['collector'] else row['collector']
-                    phot = Photometer(**row)
-                    log.info("%r", phot)
-                    session.add(phot)
+        log.info("loading photometer from %s", path)
+        with open(path, newline='', buffering=CSV_BUF_SIZE) as f:
+            # Plain csv.reader + zip against the header row skips the
+            # per-row dict machinery that DictReader pays
+            reader = csv.reader(f, delimiter=';')
+            header = next(reader)
+            while True:
+                # Single comprehension normalizes every empty string to None,
+                # instead of one conditional assignment per nullable column
+                batch = [{k: (v if v else None) for k, v in zip(header, row)}
+                    for row in itertools.islice(reader, BATCH_SIZE)]
+                if not batch:
+                    break
+                log.info("bulk inserting %d photometers", len(batch))
+                async with session.begin():
+                    await session.execute(insert(Photometer), batch)
                     
 
 async def load_summary(path, async_session: async_sessionmaker[AsyncSessionClass]) -> None:
@@ -208,29 +218,31 @@ TABLE = {
 }
 
 async def loader(args) -> None:
-    async with engine.begin() as conn:
-        if args.command not in ('all','nosamples','norounds'):
-            func = TABLE[args.command]
-            path = os.path.join(args.input_dir, args.command + '.csv')
+    # No outer engine.begin() wrapper: each load_* helper manages its own
+    # session and transaction, so holding an extra pool connection open
+    # for the whole load would only pin a slot for nothing
+    if args.command not in ('all','nosamples','norounds'):
+        func = TABLE[args.command]
+        path = os.path.join(args.input_dir, args.command + '.csv')
+        await func(path, AsyncSession)
+        if args.command == 'all':
+            assert ORPHANED_SESSIONS_IN_ROUNDS == ORPHANED_SESSIONS_IN_SAMPLES, \
+            f"Differnece is {ORPHANED_SESSIONS_IN_ROUNDS - ORPHANED_SESSIONS_IN_SAMPLES}"
+    elif args.command == 'norounds':
+          for name in ('config','batch', 'photometer', 'summary'):
+            path = os.path.join(args.input_dir, name + '.csv')
+            func = TABLE[name]
+            await func(path, AsyncSession)
+    elif args.command == 'nosamples':
+          for name in ('config','batch', 'photometer', 'summary', 'rounds'):
+            path = os.path.join(args.input_dir, name + '.csv')
+            func = TABLE[name]
+            await func(path, AsyncSession)
+    else:
+        for name in ('config','batch', 'photometer', 'summary', 'rounds', 'samples'):
+            path = os.path.join(args.input_dir, name + '.csv')
+            func = TABLE[name]
             await func(path, AsyncSession)
-            if args.command == 'all':
-                assert ORPHANED_SESSIONS_IN_ROUNDS == ORPHANED_SESSIONS_IN_SAMPLES, \
-                f"Differnece is {ORPHANED_SESSIONS_IN_ROUNDS - ORPHANED_SESSIONS_IN_SAMPLES}"
-        elif args.command == 'norounds':
-              for name in ('config','batch', 'photometer', 'summary'):
-                path = os.path.join(args.input_dir, name + '.csv')
-                func = TABLE[name]
-                await func(path, AsyncSession)
-        elif args.command == 'nosamples':
-              for name in ('config','batch', 'photometer', 'summary', 'rounds'):
-                path = os.path.join(args.input_dir, name + '.csv')
-                func = TABLE[name]
-                await func(path, AsyncSession)
-        else:
-            for name in ('config','batch', 'photometer', 'summary', 'rounds', 'samples'):
-                path = os.path.join(args.input_dir, name + '.csv')
-                func = TABLE[name]
-                await func(path, AsyncSession)
     await engine.dispose()
 
 
@@ -238,41 +250,24 @@ def add_args(parser):
 
     subparser = parser.add_subparsers(dest='command')
 
-    parser_config = subparser.add_parser('config', help='Load config CSV')
-    parser_batch = subparser.add_parser('batch', help='Load config CSV')
-    parser_phot = subparser.add_parser('photometer', help='Load photometer CSV')
-    parser_summary = subparser.add_parser('summary', help='Load summary CSV')
-    parser_rounds = subparser.add_parser('rounds', help='Load rounds CSV')
-    parser_norounds = subparser.add_parser('norounds', help='Load rounds CSV')
-    parser_samples = subparser.add_parser('samples', help='Load samples CSV')
-    parser_nosamples = subparser.add_parser('nosamples', help='Load all CSVs except samples')
-    parser_all = subparser.add_parser('all', help='Load all CSVs')
-
-    parser_config.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
-    parser_batch.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
-    parser_phot.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
-    parser_summary.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
-    parser_rounds.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
-    parser_norounds.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
-    parser_samples.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
-    parser_nosamples.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
-    parser_all.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
+    # Shared by all subcommands, wired once via the parents mechanism
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-i', '--input-dir', type=vdir, default=os.getcwd(), help='Input CSV directory (default %(default)s)')
+
+    subparser.add_parser('config', parents=[common], help='Load config CSV')
+    subparser.add_parser('batch', parents=[common], help='Load config CSV')
+    subparser.add_parser('photometer', parents=[common], help='Load photometer CSV')
+    subparser.add_parser('summary', parents=[common], help='Load summary CSV')
+    subparser.add_parser('rounds', parents=[common], help='Load rounds CSV')
+    subparser.add_parser('norounds', parents=[common], help='Load rounds CSV')
+    subparser.add_parser('samples', parents=[common], help='Load samples CSV')
+    subparser.add_parser('nosamples', parents=[common], help='Load all CSVs except samples')
+    subparser.add_parser('all', parents=[common], help='Load all CSVs')
 
 def main():
     '''The main entry point specified by pyproject.toml'''
-    parser = args_parser(
-        name = __name__,
-        version = __version__,
-        description = DESCRIPTION
-    )
-    add_args(parser)
-    args = parser.parse_args(sys.argv[1:])
-    configure_logging(args)
-    if args.verbose:
-        logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
-        logging.getLogger("aiosqlite").setLevel(logging.INFO)
-    else:
-        logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+    args = init_cli(__name__, DESCRIPTION, add_args)
+    configure_sql_logging(args)
     asyncio.run(loader(args))
 
 if __name__ == '__main__':
@@ -25,21 +25,25 @@ from typing import List
 # -------------------
 
 
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, func, and_, or_, bindparam, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession as AsyncSessionClass
 from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import configure_mappers
+
+try:
+    from numba import vectorize, float64
+except ImportError:
+    vectorize = None
 
 from lica.sqlalchemy.asyncio.dbase import engine, AsyncSession
 from lica.asyncio.photometer import Model as PhotModel, Role, Sensor
-from lica.textual.logging import configure_logging
-from lica.textual.argparse import args_parser
 from lica.validators import vfile, vdir, vdate
 
 #--------------
 # local imports
 # -------------
 
-from .. import __version__
+from ..cli import init_cli, configure_sql_logging
 from .model import Round, Photometer, Sample, Summary
 from .. import CentralTendency
 
@@ -49,6 +53,9 @@ from .. import CentralTendency
 
 DESCRIPTION = "TESS-W Calibration Database Quality Assurance tool"
 
+# Hoisted constant so magnitude() issues a single log() call per invocation
+_LOG10_INV_2_5 = 2.5 / math.log(10.0)
+
 _CENTRAL_MAP = {
     CentralTendency.MEAN: statistics.mean,
     CentralTendency.MEDIAN: statistics.median,
@@ -72,7 +79,12 @@ def central(method: CentralTendency):
 
 
 def magnitude(zp, freq):
-    return zp - 2.5*math.log10(freq)
+    return zp - _LOG10_INV_2_5*math.log(freq)
+
+if vectorize is not None:
+    # Compiled ufunc: same scalar call sites, but also applies element-wise
+    # on numpy arrays at C speed
+    magnitude = vectorize([float64(float64, float64)], nopython=True, cache=True)(magnitude)
 
 # -----------------
 # Auxiliary classes
@@ -89,14 +101,12 @@ class DbgSummary(Summary):
             log.error("[%s] [%s] [%s] Summary rounds. computed = %d, stored = %d",
                 self.n, self.m, self.s, N, self.nrounds)
 
-    def assert_fict_zp(self, rounds):
-        zps = [r.zp_fict for r in rounds]
-        if not all([r.zp_fict == rounds[0].zp_fict for r in rounds]):
+    def assert_fict_zp(self, zp_ficts):
+        if not all([zp == zp_ficts[0] for zp in zp_ficts]):
             log.error("[%s] [%s] [%s] Summary. Fict ZP: All not are equal %s",
-                self.n, self.m, [r.zp_fict for r in rounds])
+                self.n, self.m, self.s, zp_ficts)
 
-    def assert_freq_from_rounds(self, rounds):
-        freqs = [r.freq for r in rounds]
+    def assert_freq_from_rounds(self, freqs):
         central_func = central(self.freq_method)
         freq = central_func(freqs)
         if not math.fabs(freq - self.freq) < 0.0005:
@@ -104,18 +114,16 @@ class DbgSummary(Summary):
                 self.n, self.m, self.s, freq, self.freq)
         return freq
 
-    def assert_mag_from_rounds(self, rounds, freq):
-        zp_fict = rounds[0].zp_fict
+    def assert_mag_from_rounds(self, zp_fict, freq):
         mag = magnitude(zp_fict, freq)
         if not math.fabs(mag - self.mag) < 0.005:
             log.warn("[%s] [%s] [%s]  Summary Magnitudes. computed =%f from f=%f, stored mag=%f frm stored f=%f",
                 self.n, self.m, self.s, mag, freq, self.mag, self.freq)
-        
-    def assert_zp_from_rounds(self, rounds):
-        zps = [r.zero_point for r in rounds]
+
+    def assert_zp_from_rounds(self, zero_points):
         central_func = central(self.zero_point_method)
-        zp = central_func(zps) + self.zp_offset
-        if not math.fabs(zp - self.zero_point) < 0.005:        
+        zp = central_func(zero_points) + self.zp_offset
+        if not math.fabs(zp - self.zero_point) < 0.005:
             log.warn("[%s] [%s] [%s]  Summary Zero Points. computed zp=%f, stored zp=%f",
                 self.n, self.m, self.s, zp, self.zero_point)
 
@@ -125,13 +133,18 @@ class DbgSummary(Summary):
         self.s = self.session
         rounds = await self.awaitable_attrs.rounds
         log.info("[%s] [%s] [%s] Summary self check", self.n, self.m, self.s)
+        # Extract the per-round columns in a single pass,
+        # instead of one traversal per assert helper
+        freqs = [r.freq for r in rounds]
+        zp_ficts = [r.zp_fict for r in rounds]
+        zero_points = [r.zero_point for r in rounds]
         self.assert_nrounds(rounds)
-        self.assert_fict_zp(rounds)
+        self.assert_fict_zp(zp_ficts)
         if self.nrounds is not None:
-            freq = self.assert_freq_from_rounds(rounds)
-            self.assert_mag_from_rounds(rounds, freq)
+            freq = self.assert_freq_from_rounds(freqs)
+            self.assert_mag_from_rounds(zp_ficts[0], freq)
             if self.role == Role.TEST:
-                self.assert_zp_from_rounds(rounds)
+                self.assert_zp_from_rounds(zero_points)
 
 
 class DbgRound(Round):
@@ -182,14 +195,13 @@ class DbgRound(Round):
                     self.n, self.m, self.s, self.seq, self.role, s.role)
 
 
-    async def check(self,photometer, summary):
+    async def check(self,photometer, summary, total_samples_count):
         self.n = photometer.name
         self.m = photometer.mac
         self.s = summary.session
         log.info("[%s] [%s] [%s] Round #%d self check", self.n, self.m, self.s, self.seq)
-        self.assert_round_magnitude()  
-        total_samples = await summary.awaitable_attrs.samples
-        if self.nsamples > 0 and len(total_samples) == 0:
+        self.assert_round_magnitude()
+        if self.nsamples > 0 and total_samples_count == 0:
             self.assert_no_timestamps()
             log.warn("[%s] [%s] [%s] Round #%d self check ok. NO SAMPLES, (%d) reported.",
               self.n, self.m, self.s, self.seq, self.nsamples)
@@ -210,9 +222,40 @@ class DbgSample(Sample):
         log.info("[%s] [%s] [%s] Sample #%d in Rounds %s. self check ok", n, m, s, self.id, rseqs)
 
 
+# Pay the one-time mapper configuration cost at import time
+# rather than on the first awaited query
+configure_mappers()
+
+# ----------------------
+# Precompiled QA queries
+# ----------------------
+
+# Built once at import time so per-session checks skip
+# the statement construction and compilation cache lookup
+
+_Q_SUMMARY = lambda_stmt(lambda: select(DbgPhotometer, DbgSummary).
+    join(DbgSummary).
+    where(DbgSummary.session == bindparam("meas_session")).
+    order_by(DbgSummary.role.asc())
+)
+
+_Q_ROUNDS = lambda_stmt(lambda: select(DbgPhotometer, DbgSummary, DbgRound).
+    join(DbgSummary, DbgPhotometer.id == DbgSummary.phot_id).
+    join(DbgRound, DbgSummary.id == DbgRound.summ_id).
+    where(DbgSummary.session == bindparam("meas_session")).
+    order_by(DbgSummary.role.asc())
+)
+
+_Q_SAMPLES = lambda_stmt(lambda: select(DbgPhotometer, DbgSummary, DbgSample).
+    join(DbgSummary, DbgPhotometer.id == DbgSummary.phot_id).
+    join(DbgSample, DbgSummary.id == DbgSample.summ_id).
+    where(DbgSummary.session == bindparam("meas_session")).
+    order_by(DbgSummary.role.asc())
+)
+
 # -------------------
 # Auxiliary functions
-# -------------------       
+# -------------------
 
 async def get_all_sessions(async_session: async_sessionmaker[AsyncSessionClass]) -> List[datetime.datetime]:
     async with async_session() as session:
@@ -256,12 +299,7 @@ async def check_all(meas_session, async_session: async_sessionmaker[AsyncSession
 async def check_summary_single(meas_session, async_session: async_sessionmaker[AsyncSessionClass]) -> None:
     async with async_session() as session:
         async with session.begin():
-            q = (select(DbgPhotometer, DbgSummary).
-                join(DbgSummary).
-                where(DbgSummary.session == meas_session).
-                order_by(DbgSummary.role.asc())
-            )
-            result = (await session.execute(q)).all()
+            result = (await session.execute(_Q_SUMMARY, {"meas_session": meas_session})).all()
             for row in result:
                 photometer = row[0]
                 summary = row[1]
@@ -270,29 +308,25 @@ async def check_summary_single(meas_session, async_session: async_sessionmaker[A
 async def check_rounds_single(meas_session, async_session: async_sessionmaker[AsyncSessionClass]) -> None:
     async with async_session() as session:
         async with session.begin():
-            q = (select(DbgPhotometer, DbgSummary, DbgRound).
-                join(DbgSummary, DbgPhotometer.id == DbgSummary.phot_id).
-                join(DbgRound, DbgSummary.id == DbgRound.summ_id).
-                filter(DbgSummary.session == meas_session).
-                order_by(DbgSummary.role.asc())
-            )
-            result = (await session.execute(q)).all()
+            result = (await session.execute(_Q_ROUNDS, {"meas_session": meas_session})).all()
+            sample_counts = {}
             for row in result:
                 photometer = row[0]
                 summary = row[-2]
                 round_ = row[-1]
-                await round_.check(photometer, summary)
+                # One count(*) per summary, shared by all its rounds,
+                # instead of lazy-loading the whole samples collection per round
+                total_samples_count = sample_counts.get(summary.id)
+                if total_samples_count is None:
+                    q = select(func.count()).select_from(DbgSample).where(DbgSample.summ_id == summary.id)
+                    total_samples_count = (await session.scalars(q)).one()
+                    sample_counts[summary.id] = total_samples_count
+                await round_.check(photometer, summary, total_samples_count)
             
 async def check_samples_single(meas_session, async_session: async_sessionmaker[AsyncSessionClass]) -> None:
     async with async_session() as session:
         async with session.begin():
-            q = (select(DbgPhotometer, DbgSummary, DbgSample).
-                join(DbgSummary, DbgPhotometer.id == DbgSummary.phot_id).
-                join(DbgSample, DbgSummary.id == DbgSample.summ_id).
-                filter(DbgSummary.session == meas_session).
-                order_by(DbgSummary.role.asc())
-            )
-            result = (await session.execute(q)).all()
+            result = (await session.execute(_Q_SAMPLES, {"meas_session": meas_session})).all()
             for row in result:
                 photometer = row[0]
                 summary = row[-2]
@@ -327,35 +361,23 @@ async def qa(args) -> None:
 def add_args(parser):
 
     subparser = parser.add_subparsers(dest='command')
-    
-    parser_summary = subparser.add_parser('summary', help='Browse summary data')
-    parser_rounds = subparser.add_parser('rounds', help='Browse rounds data')
-    parser_samples = subparser.add_parser('samples', help='Browse samples data')
-    parser_all = subparser.add_parser('all', help='Browse all data')
 
-    parser_summary.add_argument('-s', '--session', metavar='<YYYY-MM-DDTHH:MM:SS>', type=vdate, default=None, help='Session date')
-    parser_rounds.add_argument('-s', '--session', type=vdate, default=None, help='Session date')
-    parser_samples.add_argument('-s', '--session', type=vdate, default=None, help='Session date')
-    parser_all.add_argument('-s', '--session', type=vdate, default=None, help='Session date')
- 
+    # Shared by all subcommands, wired once via the parents mechanism
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-s', '--session', metavar='<YYYY-MM-DDTHH:MM:SS>', type=vdate, default=None, help='Session date')
+
+    subparser.add_parser('summary', parents=[common], help='Browse summary data')
+    subparser.add_parser('rounds', parents=[common], help='Browse rounds data')
+    subparser.add_parser('samples', parents=[common], help='Browse samples data')
+    subparser.add_parser('all', parents=[common], help='Browse all data')
+
 
 
    
 def main():
     '''The main entry point specified by pyproject.toml'''
-    parser = args_parser(
-        name = __name__,
-        version = __version__,
-        description = DESCRIPTION
-    )
-    add_args(parser)
-    args = parser.parse_args(sys.argv[1:])
-    configure_logging(args)
-    if args.verbose:
-        logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
-        logging.getLogger("aiosqlite").setLevel(logging.INFO)
-    else:
-        logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+    args = init_cli(__name__, DESCRIPTION, add_args)
+    configure_sql_logging(args)
     asyncio.run(qa(args))
 
 if __name__ == '__main__':
@@ -20,15 +20,13 @@ from datetime import datetime
 # SQLAlchemy imports
 # -------------------
 
-from lica.textual.argparse import args_parser
-from lica.textual.logging import configure_logging
 from lica.sqlalchemy.asyncio.dbase import url, engine, Model
 
 #--------------
 # local imports
 # -------------
 
-from .. import __version__
+from ..cli import init_cli, configure_sql_logging
 
 # We must pull one model to make it work
 from .model import Config
@@ -59,18 +57,8 @@ async def schema() -> None:
 
 def main():
     '''The main entry point specified by pyproject.toml'''
-    parser = args_parser(
-        name = __name__,
-        version = __version__,
-        description = DESCRIPTION
-    )
-    args = parser.parse_args(sys.argv[1:])
-    configure_logging(args)
-    if args.verbose:
-        logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
-        logging.getLogger("aiosqlite").setLevel(logging.INFO)
-    else:
-        logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+    args = init_cli(__name__, DESCRIPTION)
+    configure_sql_logging(args)
     log.info("Creating new schema for %s", url)
     asyncio.run(schema())
 
@@ -11,23 +11,11 @@
 import sys
 import logging
 
-# -------------------
-# Third party imports
-# -------------------
-
-
-from lica.sqlalchemy.asyncio.dbase import engine, AsyncSession
-from lica.textual.argparse import args_parser
-from lica.textual.logging import configure_logging
-
 #--------------
 # local imports
 # -------------
 
-from . import __version__
-
-from .tui.view.application import MyTextualApp
-from .tui.controller import Controller
+from .cli import init_cli
 
 # ----------------
 # Module constants
@@ -48,13 +36,11 @@ log = logging.getLogger()
 
 def main():
     '''The main entry point specified by pyproject.toml'''
-    parser = args_parser(
-        name = __name__,
-        version = __version__,
-        description = DESCRIPTION
-    )
-    args = parser.parse_args(sys.argv[1:])
-    configure_logging(args)
+    args = init_cli(__name__, DESCRIPTION)
+    # Deferred imports: textual and SQLAlchemy take a sizeable fraction
+    # of a second to load, which --help/--version exits should not pay
+    from .tui.view.application import MyTextualApp
+    from .tui.controller import Controller
     try:
         controller = Controller()
         tui = MyTextualApp(controller, DESCRIPTION)
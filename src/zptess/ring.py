@@ -11,13 +11,18 @@
 import os
 import math
 import logging
-import statistics
 import collections
 
 # -------------------
 # Third party imports
 # -------------------
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 #--------------
 # local imports
@@ -34,36 +39,96 @@ import collections
 # get the root logger
 log = logging.getLogger(__name__)
 
-# ------- 
+# -------------------
+# Auxiliary functions
+# -------------------
+
+def _median_low(arr):
+    '''Lower median by O(n) selection, same semantics as statistics.median_low'''
+    k = (arr.size - 1) // 2
+    return np.partition(arr, k)[k]
+
+if njit is not None:
+    # Compiled into one tight loop, removing per-call NumPy dispatch
+    _median_low = njit(cache=True, fastmath=True)(_median_low)
+
+# -------
 # Classes
 # -------
 
 class RingBuffer:
 
+    # Fixed attribute set: no per-instance __dict__, faster attribute access
+    __slots__ = ('_buffer', '_items_append', '_capacity', '_freqs',
+        '_head', '_size', '_sum', '_sum_sq', '_zp', '_fo')
+
     def __init__(self, capacity=75, zp=20.50, fo=0.0):
         self._buffer = collections.deque([], capacity)
+        # Bound method captured once, skipping the deque attribute
+        # lookup on every sample
+        self._items_append = self._buffer.append
+        self._capacity = capacity
+        # Parallel SoA ring of frequencies, kept in sync with the deque,
+        # so the numeric paths never walk dicts
+        self._freqs = np.empty(capacity, dtype=np.float64)
+        self._head = 0
+        self._size = 0
+        # Running first and second moments, updated in O(1) per sample
+        self._sum = 0.0
+        self._sum_sq = 0.0
         self._zp = zp
         self._fo = fo
 
     def __len__(self):
-        return len(self._buffer)
+        return self._size
 
     def pop(self):
+        # Dropping the oldest item just shrinks the valid SoA region
+        old = self._freqs[(self._head - self._size) % self._capacity]
+        self._sum -= old
+        self._sum_sq -= old*old
+        self._size -= 1
         return self._buffer.popleft()
 
     def append(self, item):
-        self._buffer.append(item)
+        freq = item['freq']
+        if self._size == self._capacity:
+            # Full ring: retire the displaced sample from the accumulators
+            old = self._freqs[self._head]
+            self._sum -= old
+            self._sum_sq -= old*old
+        else:
+            self._size += 1
+        self._sum += freq
+        self._sum_sq += freq*freq
+        self._items_append(item)
+        self._freqs[self._head] = freq
+        self._head = (self._head + 1) % self._capacity
 
     def magnitude(self, f):
         return self._zp - 2.5*math.log10(f - self._fo)
 
+    def magnitudes(self):
+        '''Magnitudes for the whole window in one vectorized pass'''
+        return self._zp - 2.5*np.log10(self._freqs_view() - self._fo)
+
+    def _freqs_view(self):
+        '''Valid frequencies in insertion order, without copy unless wrapped'''
+        start = (self._head - self._size) % self._capacity
+        end = start + self._size
+        if end <= self._capacity:
+            return self._freqs[start:end]
+        return np.concatenate((self._freqs[start:], self._freqs[:end - self._capacity]))
+
     def frequencies(self):
-        return [item['freq'] for item in self._buffer]
-        
+        return self._freqs_view().tolist()
+
     def statistics(self):
-        frequencies = [item['freq'] for item in self._buffer]
-        median = statistics.median_low(frequencies)
-        aver = statistics.fmean(frequencies)
-        stdev = statistics.stdev(frequencies, aver)
+        # Mean and stdev in O(1) from the running moments;
+        # only the median still needs a pass over the window
+        n = self._size
+        aver = self._sum / n
+        var = (self._sum_sq - self._sum*self._sum/n) / (n - 1)
+        stdev = math.sqrt(var) if var > 0.0 else 0.0
+        median = float(_median_low(self._freqs_view()))
         return median, aver, stdev
-    
\ No newline at end of file
@@ -44,6 +44,17 @@ log = logging.getLogger()
 # Auxiliary functions
 # -------------------
 
+# Per-role loggers created once, instead of paying the manager lock
+# and dict lookup inside logging.getLogger() on every call
+_LOGGERS = {}
+
+def _logger(role):
+    logger = _LOGGERS.get(role)
+    if logger is None:
+        logger = logging.getLogger(role.tag())
+        _LOGGERS[role] = logger
+    return logger
+
 # -------
 # Classes
 # -------
@@ -86,7 +97,7 @@ class Controller:
           
     async def get_info(self, role):
         '''Get Photometer Info'''
-        log = logging.getLogger(role.tag())
+        log = _logger(role)
         try:
             info = await self.photometer[role].get_info()
         except asyncio.exceptions.TimeoutError:
@@ -123,14 +134,27 @@ class Controller:
             self.cur_mac[role] = info.get('mac')
 
     async def receive(self, role):
+        # Bind the per-role objects once so the per-reading loop
+        # works on locals instead of repeated self.xxx[role] lookups
+        queue = self.photometer[role].queue
+        ring = self.ring[role]
+        view = self.view
         while True:
-            msg = await self.photometer[role].queue.get()
-            self.ring[role].append(msg)
-            line = f"{msg['tstamp'].strftime('%Y-%m-%d %H:%M:%S')} [{msg.get('seq')}] f={msg['freq']} Hz, tbox={msg['tamb']}, tsky={msg['tsky']}"
-            self.view.append_log(role, line)
-            self.view.update_progress(role, 1)
-            data = self.ring[role].frequencies()
-            self.view.update_graph(role, data)
+            msg = await queue.get()
+            batch = [msg]
+            # Opportunistically drain whatever else has already arrived,
+            # so a burst costs one task switch instead of one per sample
+            while True:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            for msg in batch:
+                ring.append(msg)
+                line = f"{msg['tstamp'].strftime('%Y-%m-%d %H:%M:%S')} [{msg.get('seq')}] f={msg['freq']} Hz, tbox={msg['tamb']}, tsky={msg['tsky']}"
+                view.append_log(role, line)
+            view.update_progress(role, len(batch))
+            view.update_graph(role, ring.frequencies())
 
     def cancel_readings(self, role):
         self.producer[role].cancel()
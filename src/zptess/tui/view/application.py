@@ -93,32 +93,33 @@ class MyTextualApp(App[str]):
 
 
     def on_mount(self) -> None:
-        self.log_w[Role.REF] = self.query_one("#ref_log")
-        self.log_w[Role.TEST] = self.query_one("#tst_log")
+        # The expected widget type as second argument lets query_one take
+        # the fast id+type path instead of parsing a CSS selector
+        self.log_w[Role.REF] = self.query_one("#ref_log", Log)
+        self.log_w[Role.TEST] = self.query_one("#tst_log", Log)
         return
 
         # Apparently containers do not have a border_title to show
-        for ident in ("#ref_metadata", "#tst_metadata"):
-            table = self.query_one(ident)
+        # One DOM walk per table: capture the reference and configure it
+        # in the same pass
+        for role, ident in ((Role.REF, "#ref_metadata"), (Role.TEST, "#tst_metadata")):
+            table = self.query_one(ident, DataTable)
+            self.metadata_w[role] = table
             table.add_columns(*("Property", "Value"))
             table.fixed_columns = 2
             table.show_cursor = False
-        
-        
 
-        self.graph_w[Role.REF] = self.query_one("#ref_graph")
-        self.graph_w[Role.TEST] = self.query_one("#tst_graph")
+        self.graph_w[Role.REF] = self.query_one("#ref_graph", Sparkline)
+        self.graph_w[Role.TEST] = self.query_one("#tst_graph", Sparkline)
         self.graph_w[Role.REF].border_title = f"{Role.REF} LOG"
         self.graph_w[Role.TEST].border_title = f"{Role.TEST} LOG"
-        
-        self.switch_w[Role.REF] = self.query_one("#ref_phot")
-        self.switch_w[Role.TEST] = self.query_one("#tst_phot")
+
+        self.switch_w[Role.REF] = self.query_one("#ref_phot", Switch)
+        self.switch_w[Role.TEST] = self.query_one("#tst_phot", Switch)
         self.switch_w[Role.REF].border_title = 'ON'
         self.switch_w[Role.TEST].border_title = 'ON'
-        self.metadata_w[Role.REF] =  self.query_one("#ref_metadata")
-        self.metadata_w[Role.TEST] = self.query_one("#tst_metadata")
-        self.progress_w[Role.REF] =  self.query_one("#ref_ring")
-        self.progress_w[Role.TEST] = self.query_one("#tst_ring")
+        self.progress_w[Role.REF] =  self.query_one("#ref_ring", ProgressBar)
+        self.progress_w[Role.TEST] = self.query_one("#tst_ring", ProgressBar)
         self.progress_w[Role.REF].total = 75
         self.progress_w[Role.TEST].total = 75
       
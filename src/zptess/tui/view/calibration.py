@@ -88,18 +88,18 @@ class CalibrationPane(Static):
 
 
     def on_mount(self) -> None:
-        self.log_w[Role.REF] = self.query_one("#ref_log")
-        self.log_w[Role.TEST] = self.query_one("#tst_log")
+        self.log_w[Role.REF] = self.query_one("#ref_log", Log)
+        self.log_w[Role.TEST] = self.query_one("#tst_log", Log)
         self.log_w[Role.REF].border_title = f"{Role.REF.tag()} LOG"
         self.log_w[Role.TEST].border_title = f"{Role.TEST.tag()} LOG"
-        self.stats_w = self.query_one("#stats_table")
+        self.stats_w = self.query_one("#stats_table", DataTable)
         self.stats_w.add_columns(*("Round #", "Freq (Hz)", "Magnitude", "\u0394 Magnitude", "Zero Point"))
         self.stats_w.fixed_columns = 5
         self.stats_w.show_cursor = False
-        self.ok_button_w = self.query_one("#ok_button")
-        self.cancel_button_w = self.query_one("#cancel_button")
+        self.ok_button_w = self.query_one("#ok_button", Button)
+        self.cancel_button_w = self.query_one("#cancel_button", Button)
         for ident in ("#ref_phot_info", "#tst_phot_info"):
-            table = self.query_one(ident)
+            table = self.query_one(ident, DataTable)
             table.add_columns(*("Property", "Value"))
             table.fixed_columns = 2
             table.show_cursor = False